@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+cosmicboard-icons: single entry point for the CosmicBoard icon tooling
+- list    show the renderable variants
+- render  render variants to standalone PNGs at the given sizes
+- build   regenerate the icon sets, skipping variants whose sources are unchanged
+- export  write the SVG / VectorDrawable adaptive icon layers
+- bench   time each variant's render at the given sizes
+
+Only the standard library loads up front; Pillow, NumPy and the generators
+are imported inside the subcommand that needs them, so `list` and cache-hit
+builds start in tens of milliseconds.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import sys
+import time
+
+from icon_variants import ADAPTIVE_LAYERS, ICONS_ROOT, VARIANTS, load_variant, variant_source_paths
+
+CACHE_FILE = '.build-cache.json'
+ADAPTIVE_PREVIEW = 'v1-orbital-alignment/android-adaptive/preview_circle.png'
+
+def cmd_list(args):
+    """Print every variant with what it renders and where it is defined"""
+    for name, (module_name, func_name) in VARIANTS.items():
+        kind = 'adaptive layer' if name in ADAPTIVE_LAYERS else 'icon set'
+        print(f'{name:26} {kind:15} {module_name}.{func_name}')
+
+def _render_one(name, size, output_dir):
+    """Render one variant at one size and save it (runs in a worker with --jobs)"""
+    filepath = os.path.join(output_dir, f'{name}-{size}.png')
+    load_variant(name)(size).save(filepath, 'PNG')
+    return filepath
+
+def cmd_render(args):
+    """Render the selected variants at each requested size"""
+    os.makedirs(args.out, exist_ok=True)
+    tasks = [(name, size) for name in args.variants for size in args.sizes]
+
+    if args.jobs > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(_render_one, name, size, args.out) for name, size in tasks]
+            for future in futures:
+                print(f'✓ Saved {future.result()}')
+    else:
+        for name, size in tasks:
+            print(f'✓ Saved {_render_one(name, size, args.out)}')
+
+def _build_key(name, sizes):
+    """Fingerprint of everything a variant's build output depends on"""
+    digest = hashlib.sha256(f'{name}:{sizes}'.encode())
+    for path in variant_source_paths(name):
+        with open(path, 'rb') as source:
+            digest.update(source.read())
+    return digest.hexdigest()
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path) as cache_file:
+            return json.load(cache_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _build_variant(name, output_base, sizes, executor):
+    """Render one variant at 1024px and write its outputs; return their paths"""
+    icon = load_variant(name)(1024)
+
+    if name in ADAPTIVE_LAYERS:
+        filepath = os.path.join(output_base, ADAPTIVE_LAYERS[name])
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        icon.save(filepath, 'PNG')
+        print(f'✓ Saved {filepath}')
+        return [filepath]
+
+    from generate_app_icons import save_version
+    return save_version(icon, os.path.join(output_base, name), sizes, executor)
+
+def _build_adaptive_preview(output_base):
+    """Recomposite the circle preview from the adaptive layers on disk"""
+    from PIL import Image
+    from generate_android_adaptive_icons import create_adaptive_preview
+
+    with Image.open(os.path.join(output_base, ADAPTIVE_LAYERS['android-background'])) as background, \
+            Image.open(os.path.join(output_base, ADAPTIVE_LAYERS['android-foreground'])) as foreground:
+        preview = create_adaptive_preview(background.convert('RGBA'), foreground.convert('RGBA'))
+
+    filepath = os.path.join(output_base, ADAPTIVE_PREVIEW)
+    preview.save(filepath, 'PNG')
+    print(f'✓ Saved {filepath}')
+
+def cmd_build(args):
+    """Build icon sets and adaptive layers, reusing outputs whose sources are unchanged"""
+    os.makedirs(args.out, exist_ok=True)
+    cache_path = os.path.join(args.out, CACHE_FILE)
+    cache = _load_cache(cache_path)
+    sizes = sorted(args.sizes) if args.sizes else None
+    rebuilt = set()
+
+    # One worker pool for the whole build, started only once something needs rebuilding
+    with contextlib.ExitStack() as stack:
+        executor = None
+        for name in args.variants:
+            key = _build_key(name, sizes)
+            entry = cache.get(name)
+            if (not args.force and entry and entry['key'] == key
+                    and all(os.path.exists(os.path.join(args.out, path)) for path in entry['outputs'])):
+                print(f'✓ {name}: up to date')
+                continue
+
+            if args.jobs > 1 and executor is None:
+                from concurrent.futures import ProcessPoolExecutor
+                executor = stack.enter_context(ProcessPoolExecutor(max_workers=args.jobs))
+
+            print(f'\n🎨 Building {name}')
+            outputs = _build_variant(name, args.out, sizes, executor)
+            cache[name] = {'key': key, 'outputs': [os.path.relpath(path, args.out) for path in outputs]}
+            rebuilt.add(name)
+
+            # Save after every variant so an interrupted build keeps its progress
+            with open(cache_path, 'w') as cache_file:
+                json.dump(cache, cache_file, indent=2)
+
+    layers = [os.path.join(args.out, ADAPTIVE_LAYERS[name])
+              for name in ('android-background', 'android-foreground')]
+    if rebuilt & {'android-background', 'android-foreground'} and all(map(os.path.exists, layers)):
+        _build_adaptive_preview(args.out)
+
+def cmd_export(args):
+    """Export the vector adaptive icon layers, optionally checking them"""
+    from export_vector_icons import CHECK_TOLERANCE, check_vectors, export_vectors
+
+    export_vectors(os.path.join(args.out, 'v1-orbital-alignment'))
+    if args.check:
+        print("\n🔍 Comparing vector and raster renders...")
+        tolerance = CHECK_TOLERANCE if args.tolerance is None else args.tolerance
+        if not check_vectors(tolerance=tolerance):
+            return 1
+    return 0
+
+def cmd_bench(args):
+    """Time each variant's render, cold (shared backdrop cache cleared each run)"""
+    from generate_app_icons import _cached_backdrop
+
+    print(f"{'variant':26} {'size':>6}  {'best':>9}  {'mean':>9}")
+    for name in args.variants:
+        render = load_variant(name)
+        for size in args.sizes:
+            timings = []
+            for _ in range(args.repeat):
+                _cached_backdrop.cache_clear()
+                start = time.perf_counter()
+                render(size)
+                timings.append(time.perf_counter() - start)
+            print(f'{name:26} {size:>4}px  {min(timings) * 1000:7.1f}ms  '
+                  f'{sum(timings) / len(timings) * 1000:7.1f}ms')
+
+def create_parser():
+    """Argument parser for all subcommands"""
+    parser = argparse.ArgumentParser(prog='cosmicboard-icons',
+                                     description='Render, build, export and benchmark CosmicBoard icons')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_variants(subparser):
+        subparser.add_argument('--variants', nargs='+', choices=list(VARIANTS), default=list(VARIANTS),
+                               metavar='VARIANT', help='variants to process (default: all; see `list`)')
+
+    def add_jobs(subparser):
+        subparser.add_argument('--jobs', type=int, default=1,
+                               help='worker processes (default: 1)')
+
+    list_parser = commands.add_parser('list', help='show the renderable variants')
+    list_parser.set_defaults(handler=cmd_list)
+
+    render_parser = commands.add_parser('render', help='render variants to standalone PNGs')
+    render_parser.add_argument('--out', default=os.path.join(ICONS_ROOT, '.render'),
+                               help='output directory (default: app-icons/.render)')
+    render_parser.add_argument('--sizes', nargs='+', type=int, default=[1024],
+                               help='pixel sizes to render (default: 1024)')
+    add_variants(render_parser)
+    add_jobs(render_parser)
+    render_parser.set_defaults(handler=cmd_render)
+
+    build_parser = commands.add_parser('build', help='regenerate icon sets and adaptive layers')
+    build_parser.add_argument('--out', default=ICONS_ROOT,
+                               help='icons root to write into (default: app-icons)')
+    build_parser.add_argument('--sizes', nargs='+', type=int,
+                               help='only write these icon-set sizes (default: all)')
+    build_parser.add_argument('--force', action='store_true',
+                               help='rebuild even if sources are unchanged')
+    add_variants(build_parser)
+    add_jobs(build_parser)
+    build_parser.set_defaults(handler=cmd_build)
+
+    export_parser = commands.add_parser('export', help='write SVG and VectorDrawable layers')
+    export_parser.add_argument('--out', default=ICONS_ROOT,
+                               help='icons root to write into (default: app-icons)')
+    export_parser.add_argument('--check', action='store_true',
+                               help='compare rasterized SVGs and VectorDrawables with the PNG renders')
+    export_parser.add_argument('--tolerance', type=float,
+                               help='max %% of mismatched pixels for --check (default: 0.01)')
+    export_parser.set_defaults(handler=cmd_export)
+
+    bench_parser = commands.add_parser('bench', help='time variant renders')
+    bench_parser.add_argument('--sizes', nargs='+', type=int, default=[256, 1024],
+                              help='pixel sizes to time (default: 256 1024)')
+    bench_parser.add_argument('--repeat', type=int, default=3,
+                              help='renders per variant and size (default: 3)')
+    add_variants(bench_parser)
+    bench_parser.set_defaults(handler=cmd_bench)
+
+    return parser
+
+def main(argv=None):
+    """Parse arguments and run the chosen subcommand"""
+    args = create_parser().parse_args(argv)
+    return args.handler(args) or 0
+
+if __name__ == '__main__':
+    sys.exit(main())
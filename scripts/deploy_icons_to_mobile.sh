@@ -11,9 +11,14 @@ BLUE='\033[0;34m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
-# Paths
-ICON_SOURCE="/Users/sammuthu/Projects/cosmicboard/app-icons"
-MOBILE_PROJECT="/Users/sammuthu/Projects/cosmicboard-mobile"
+# Paths (override with ICON_SOURCE / MOBILE_PROJECT environment variables)
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+ICON_SOURCE="${ICON_SOURCE:-$SCRIPT_DIR/../app-icons}"
+MOBILE_PROJECT="${MOBILE_PROJECT:-/Users/sammuthu/Projects/cosmicboard-mobile}"
+
+# Lowest Android API level the app supports (Expo's default is 24). At 26+
+# every device uses the vector adaptive icon, so no per-density PNGs are copied
+ANDROID_MIN_SDK="${ANDROID_MIN_SDK:-24}"
 
 # Version to deploy (default: v1-orbital-alignment)
 VERSION="${1:-v1-orbital-alignment}"
@@ -90,48 +95,69 @@ if [ -d "$ANDROID_RES_DIR" ]; then
     # Remove any existing .webp files to avoid conflicts
     find "$ANDROID_RES_DIR/mipmap-"* -name "*.webp" -type f -delete 2>/dev/null || true
 
-    # Remove adaptive icon XML files (we're using PNG directly)
-    rm -rf "$ANDROID_RES_DIR/mipmap-anydpi-v26" 2>/dev/null || true
-
-    # Create mipmap directories and copy icons
-    # mdpi (48px)
-    mkdir -p "$ANDROID_RES_DIR/mipmap-mdpi"
-    if [ -f "$ICON_SOURCE/$VERSION/android/icon-48.png" ]; then
-        cp "$ICON_SOURCE/$VERSION/android/icon-48.png" "$ANDROID_RES_DIR/mipmap-mdpi/ic_launcher.png"
-        cp "$ICON_SOURCE/$VERSION/android/icon-48.png" "$ANDROID_RES_DIR/mipmap-mdpi/ic_launcher_round.png"
-        echo "  ✓ Deployed mdpi icons (48×48)"
-    fi
-
-    # hdpi (72px)
-    mkdir -p "$ANDROID_RES_DIR/mipmap-hdpi"
-    if [ -f "$ICON_SOURCE/$VERSION/android/icon-72.png" ]; then
-        cp "$ICON_SOURCE/$VERSION/android/icon-72.png" "$ANDROID_RES_DIR/mipmap-hdpi/ic_launcher.png"
-        cp "$ICON_SOURCE/$VERSION/android/icon-72.png" "$ANDROID_RES_DIR/mipmap-hdpi/ic_launcher_round.png"
-        echo "  ✓ Deployed hdpi icons (72×72)"
-    fi
-
-    # xhdpi (96px)
-    mkdir -p "$ANDROID_RES_DIR/mipmap-xhdpi"
-    if [ -f "$ICON_SOURCE/$VERSION/android/icon-96.png" ]; then
-        cp "$ICON_SOURCE/$VERSION/android/icon-96.png" "$ANDROID_RES_DIR/mipmap-xhdpi/ic_launcher.png"
-        cp "$ICON_SOURCE/$VERSION/android/icon-96.png" "$ANDROID_RES_DIR/mipmap-xhdpi/ic_launcher_round.png"
-        echo "  ✓ Deployed xhdpi icons (96×96)"
-    fi
-
-    # xxhdpi (144px)
-    mkdir -p "$ANDROID_RES_DIR/mipmap-xxhdpi"
-    if [ -f "$ICON_SOURCE/$VERSION/android/icon-144.png" ]; then
-        cp "$ICON_SOURCE/$VERSION/android/icon-144.png" "$ANDROID_RES_DIR/mipmap-xxhdpi/ic_launcher.png"
-        cp "$ICON_SOURCE/$VERSION/android/icon-144.png" "$ANDROID_RES_DIR/mipmap-xxhdpi/ic_launcher_round.png"
-        echo "  ✓ Deployed xxhdpi icons (144×144)"
+    # Vector adaptive icon (API 26+): <vector> layers plus the <adaptive-icon> XML,
+    # a few KB in place of a raster per density
+    VECTOR_SOURCE="$ICON_SOURCE/$VERSION/android-vector"
+    if [ -d "$VECTOR_SOURCE" ]; then
+        # Replace only the launcher layers; other drawables in the app stay untouched
+        rm -rf "$ANDROID_RES_DIR/mipmap-anydpi-v26"
+        rm -f "$ANDROID_RES_DIR"/drawable-anydpi-v26/ic_launcher_*.xml
+        mkdir -p "$ANDROID_RES_DIR/drawable-anydpi-v26"
+        cp "$VECTOR_SOURCE/drawable-anydpi-v26"/ic_launcher_*.xml "$ANDROID_RES_DIR/drawable-anydpi-v26/"
+        cp -R "$VECTOR_SOURCE/mipmap-anydpi-v26" "$ANDROID_RES_DIR/"
+        echo "  ✓ Deployed vector adaptive icon (drawable-/mipmap-anydpi-v26)"
+    else
+        # No vectors for this version: drop stale adaptive icon XML so the PNGs are used
+        rm -rf "$ANDROID_RES_DIR/mipmap-anydpi-v26" 2>/dev/null || true
+        rm -f "$ANDROID_RES_DIR"/drawable-anydpi-v26/ic_launcher_*.xml 2>/dev/null || true
     fi
 
-    # xxxhdpi (192px)
-    mkdir -p "$ANDROID_RES_DIR/mipmap-xxxhdpi"
-    if [ -f "$ICON_SOURCE/$VERSION/android/icon-192.png" ]; then
-        cp "$ICON_SOURCE/$VERSION/android/icon-192.png" "$ANDROID_RES_DIR/mipmap-xxxhdpi/ic_launcher.png"
-        cp "$ICON_SOURCE/$VERSION/android/icon-192.png" "$ANDROID_RES_DIR/mipmap-xxxhdpi/ic_launcher_round.png"
-        echo "  ✓ Deployed xxxhdpi icons (192×192)"
+    if [ -d "$VECTOR_SOURCE" ] && [ "$ANDROID_MIN_SDK" -ge 26 ]; then
+        # Vector icon covers every supported device; remove old density rasters
+        rm -f "$ANDROID_RES_DIR"/mipmap-*dpi/ic_launcher.png "$ANDROID_RES_DIR"/mipmap-*dpi/ic_launcher_round.png
+        echo "  ✓ Skipped per-density PNGs (ANDROID_MIN_SDK=$ANDROID_MIN_SDK)"
+    else
+        # Per-density PNGs: the launcher icon on devices below API 26
+
+        # mdpi (48px)
+        mkdir -p "$ANDROID_RES_DIR/mipmap-mdpi"
+        if [ -f "$ICON_SOURCE/$VERSION/android/icon-48.png" ]; then
+            cp "$ICON_SOURCE/$VERSION/android/icon-48.png" "$ANDROID_RES_DIR/mipmap-mdpi/ic_launcher.png"
+            cp "$ICON_SOURCE/$VERSION/android/icon-48.png" "$ANDROID_RES_DIR/mipmap-mdpi/ic_launcher_round.png"
+            echo "  ✓ Deployed mdpi icons (48×48)"
+        fi
+
+        # hdpi (72px)
+        mkdir -p "$ANDROID_RES_DIR/mipmap-hdpi"
+        if [ -f "$ICON_SOURCE/$VERSION/android/icon-72.png" ]; then
+            cp "$ICON_SOURCE/$VERSION/android/icon-72.png" "$ANDROID_RES_DIR/mipmap-hdpi/ic_launcher.png"
+            cp "$ICON_SOURCE/$VERSION/android/icon-72.png" "$ANDROID_RES_DIR/mipmap-hdpi/ic_launcher_round.png"
+            echo "  ✓ Deployed hdpi icons (72×72)"
+        fi
+
+        # xhdpi (96px)
+        mkdir -p "$ANDROID_RES_DIR/mipmap-xhdpi"
+        if [ -f "$ICON_SOURCE/$VERSION/android/icon-96.png" ]; then
+            cp "$ICON_SOURCE/$VERSION/android/icon-96.png" "$ANDROID_RES_DIR/mipmap-xhdpi/ic_launcher.png"
+            cp "$ICON_SOURCE/$VERSION/android/icon-96.png" "$ANDROID_RES_DIR/mipmap-xhdpi/ic_launcher_round.png"
+            echo "  ✓ Deployed xhdpi icons (96×96)"
+        fi
+
+        # xxhdpi (144px)
+        mkdir -p "$ANDROID_RES_DIR/mipmap-xxhdpi"
+        if [ -f "$ICON_SOURCE/$VERSION/android/icon-144.png" ]; then
+            cp "$ICON_SOURCE/$VERSION/android/icon-144.png" "$ANDROID_RES_DIR/mipmap-xxhdpi/ic_launcher.png"
+            cp "$ICON_SOURCE/$VERSION/android/icon-144.png" "$ANDROID_RES_DIR/mipmap-xxhdpi/ic_launcher_round.png"
+            echo "  ✓ Deployed xxhdpi icons (144×144)"
+        fi
+
+        # xxxhdpi (192px)
+        mkdir -p "$ANDROID_RES_DIR/mipmap-xxxhdpi"
+        if [ -f "$ICON_SOURCE/$VERSION/android/icon-192.png" ]; then
+            cp "$ICON_SOURCE/$VERSION/android/icon-192.png" "$ANDROID_RES_DIR/mipmap-xxxhdpi/ic_launcher.png"
+            cp "$ICON_SOURCE/$VERSION/android/icon-192.png" "$ANDROID_RES_DIR/mipmap-xxxhdpi/ic_launcher_round.png"
+            echo "  ✓ Deployed xxxhdpi icons (192×192)"
+        fi
     fi
 
     # Copy Play Store icon
@@ -156,7 +182,7 @@ echo "   • Main app icon (1024×1024)"
 echo "   • Android adaptive icon (512×512)"
 echo "   • Splash screen icon"
 echo "   • iOS icons (all required sizes)"
-echo "   • Android icons (all densities)"
+echo "   • Android icons (vector adaptive icon where available, PNGs below API 26)"
 echo ""
 echo -e "${GREEN}🔄 Next steps:${NC}"
 echo "   1. Clear build cache: cd $MOBILE_PROJECT && npx expo start -c"
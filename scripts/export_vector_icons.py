@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Export CosmicBoard Vector Icons
+Emits the Android adaptive icon layers as SVG and Android VectorDrawable XML
+(plus the <adaptive-icon> wrappers) from the same scene geometry the PNG
+generators draw, so the APK no longer needs a raster per density.
+
+--check rasterizes both outputs (the SVGs, and the VectorDrawables translated
+back to SVG) and compares them with the PNG renderer output.
+"""
+
+import argparse
+import functools
+import io
+import itertools
+import math
+import os
+import xml.etree.ElementTree as ET
+
+from generate_android_adaptive_icons import android_background_scene, android_foreground_scene
+from generate_monochrome_icon import monochrome_scene
+from icon_variants import ICONS_ROOT
+
+VIEWPORT = 1024  # scene units; matches the 1024px PNG masters
+ICON_DP = 108    # adaptive icon layers are 108x108dp
+ANDROID_NS = '{http://schemas.android.com/apk/res/android}'
+AAPT_NS = '{http://schemas.android.com/aapt}'
+CHECK_THRESHOLD = 32    # per-channel difference (0-255) that counts a pixel as mismatched
+CHECK_TOLERANCE = 0.01  # max % of pixels that may mismatch between vector and raster
+
+def _fmt(value):
+    """Compact number for path data"""
+    return f'{value:.2f}'.rstrip('0').rstrip('.')
+
+def _rgba(color):
+    """Pad an RGB color to RGBA"""
+    return tuple(color) if len(color) == 4 else (*color, 255)
+
+def _hex(color):
+    """'#RRGGBB' and the 0-1 opacity of an RGB(A) color"""
+    r, g, b, a = _rgba(color)
+    return f'#{r:02X}{g:02X}{b:02X}', _fmt(a / 255)
+
+def circle(cx, cy, r, fill=None, stroke=None, gradient=None):
+    """A circle shape; `stroke` is (color, width), `gradient` is [(offset, color), ...]"""
+    return {'kind': 'circle', 'cx': cx, 'cy': cy, 'r': r,
+            'fill': fill, 'stroke': stroke, 'gradient': gradient}
+
+def ring(cx, cy, r, width, color):
+    """
+    Ring matching ImageDraw.ellipse(outline=..., width=...), which draws the
+    outline inside the bounding circle, so the stroke is centered at r - width/2
+    """
+    return circle(cx, cy, r - width / 2, stroke=(color, width))
+
+def foreground_shapes(scene):
+    """Vector shapes for the adaptive foreground (rings, gradient nodes, core)"""
+    center = scene['center']
+    shapes = [ring(center, center, radius, width, color)
+              for radius, width, color in scene['rings']]
+
+    # Nodes fade from transparent at the center to opaque at the rim
+    for (x, y), color in scene['nodes']:
+        shapes.append(circle(x, y, scene['node_radius'], gradient=[
+            (0, (*color, 0)), (1, (*color, 255))]))
+
+    # Core glow fades out from 80 alpha at the core edge to 0 at 1.8x; the
+    # raster's outermost glow ellipse is int(1.8x), and it covers the inner ring
+    core_radius = scene['core_radius']
+    glow_radius = int(core_radius * 1.8)
+    glow = scene['core_glow_color']
+    shapes.append(circle(center, center, glow_radius, gradient=[
+        (0, (*glow, 80)), (core_radius / glow_radius, (*glow, 80)), (1, (*glow, 0))]))
+    shapes.append(circle(center, center, core_radius, gradient=[
+        (0, scene['core_inner_color']), (1, scene['core_outer_color'])]))
+
+    return shapes
+
+def background_shapes(scene):
+    """Vector shapes for the adaptive background (radial gradient, sparkles)"""
+    center = scene['center']
+    colors = scene['colors']
+    # Outer third darkens the edge color by 30%, like the raster bands
+    edge = tuple(int(channel * 0.7) for channel in colors[2])
+
+    shapes = [{'kind': 'rect', 'cx': center, 'cy': center, 'r': scene['max_radius'],
+               'gradient': [(0, colors[0]), (0.33, colors[1]), (0.66, colors[2]), (1, edge)]}]
+    for x, y in scene['sparkles']:
+        shapes.append(circle(x, y, scene['sparkle_radius'], fill=scene['sparkle_color']))
+
+    return shapes
+
+def monochrome_shapes(scene):
+    """Vector shapes for the themed-icon monochrome layer (solid white)"""
+    white = (255, 255, 255, 255)
+    center = scene['center']
+    shapes = [ring(center, center, radius, width, white) for radius, width in scene['rings']]
+    shapes += [circle(x, y, scene['node_radius'], fill=white) for x, y in scene['nodes']]
+    shapes.append(circle(center, center, scene['core_radius'], fill=white))
+    return shapes
+
+def _opaque(shape):
+    """True if every color a shape paints is fully opaque"""
+    colors = [color for _, color in shape['gradient']] if shape.get('gradient') else [shape['fill']]
+    return all(_rgba(color)[3] == 255 for color in colors)
+
+def _overlaps(shape, disk):
+    """True if a filled circle covers any part of what a shape paints"""
+    if shape['kind'] == 'rect':
+        return True
+    distance = math.hypot(shape['cx'] - disk['cx'], shape['cy'] - disk['cy'])
+    inner, outer = 0, shape['r']
+    if shape.get('stroke'):
+        half = shape['stroke'][1] / 2
+        inner, outer = shape['r'] - half, shape['r'] + half
+    return distance < outer + disk['r'] and distance + disk['r'] > inner
+
+def occlude(shapes):
+    """
+    ImageDraw replaces pixels instead of blending, so a translucent circle
+    hides whatever was drawn under it (the nodes and core glow cut into the
+    rings, sparkles punch see-through spots in the background). Record those circles
+    as `holes` on each covered shape so the vectors are clipped the same way.
+    Holes are cut by winding, so the ones on a shape must not overlap.
+    """
+    for index, shape in enumerate(shapes):
+        holes = [later for later in shapes[index + 1:]
+                 if later['kind'] == 'circle' and not later.get('stroke')
+                 and not _opaque(later) and _overlaps(shape, later)]
+        for position, hole in enumerate(holes):
+            if any(_overlaps(hole, other) for other in holes[position + 1:]):
+                raise ValueError(f'overlapping circles cover shape {index}; cannot clip by winding')
+        shape['holes'] = [(hole['cx'], hole['cy'], hole['r']) for hole in holes]
+    return shapes
+
+def _circle_path(cx, cy, r):
+    # Two half arcs: the chord must be exactly twice the written radius, or
+    # each arc's center drifts off the chord (by ~1.5px on the outer ring)
+    r = float(_fmt(r))
+    return (f'M{_fmt(cx - r)},{_fmt(cy)}'
+            f'a{_fmt(r)},{_fmt(r)} 0 1,0 {_fmt(2 * r)},0'
+            f'a{_fmt(r)},{_fmt(r)} 0 1,0 {_fmt(-2 * r)},0Z')
+
+def _clip_path(holes, size):
+    """Canvas minus the holes: a clockwise square with counter-clockwise circles"""
+    return f'M0,0h{size}v{size}h-{size}Z' + ''.join(_circle_path(*hole) for hole in holes)
+
+def to_svg(shapes, size=VIEWPORT):
+    """Serialize shapes as an SVG document"""
+    def paint(prefix, color):
+        hex_color, opacity = _hex(color)
+        return f'{prefix}="{hex_color}" {prefix}-opacity="{opacity}"'
+
+    def stop(offset, color):
+        hex_color, opacity = _hex(color)
+        return f'<stop offset="{_fmt(offset)}" stop-color="{hex_color}" stop-opacity="{opacity}"/>'
+
+    defs, body = [], []
+    for index, shape in enumerate(shapes):
+        cx, cy, r = shape['cx'], shape['cy'], shape['r']
+        attrs = []
+
+        if shape.get('gradient'):
+            stops = ''.join(stop(offset, color) for offset, color in shape['gradient'])
+            defs.append(f'<radialGradient id="g{index}" gradientUnits="userSpaceOnUse" '
+                        f'cx="{_fmt(cx)}" cy="{_fmt(cy)}" r="{_fmt(r)}">{stops}</radialGradient>')
+            attrs.append(f'fill="url(#g{index})"')
+        elif shape.get('fill'):
+            attrs.append(paint('fill', shape['fill']))
+        else:
+            attrs.append('fill="none"')
+
+        if shape.get('stroke'):
+            color, width = shape['stroke']
+            attrs.append(f'{paint("stroke", color)} stroke-width="{_fmt(width)}"')
+
+        if shape.get('holes'):
+            defs.append(f'<clipPath id="c{index}"><path d="{_clip_path(shape["holes"], size)}"/></clipPath>')
+            attrs.append(f'clip-path="url(#c{index})"')
+
+        if shape['kind'] == 'rect':
+            body.append(f'<rect width="{size}" height="{size}" {" ".join(attrs)}/>')
+        else:
+            body.append(f'<circle cx="{_fmt(cx)}" cy="{_fmt(cy)}" r="{_fmt(r)}" {" ".join(attrs)}/>')
+
+    lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+             f'viewBox="0 0 {size} {size}">']
+    if defs:
+        lines += ['<defs>', *defs, '</defs>']
+    lines += [*body, '</svg>', '']
+    return '\n'.join(lines)
+
+def to_vector_drawable(shapes, size=VIEWPORT):
+    """Serialize shapes as an Android <vector> drawable (gradients need API 24+)"""
+    def argb(color):
+        r, g, b, a = _rgba(color)
+        return f'#{a:02X}{r:02X}{g:02X}{b:02X}'
+
+    lines = [
+        '<vector xmlns:android="http://schemas.android.com/apk/res/android"',
+        '    xmlns:aapt="http://schemas.android.com/aapt"',
+        f'    android:width="{ICON_DP}dp"',
+        f'    android:height="{ICON_DP}dp"',
+        f'    android:viewportWidth="{size}"',
+        f'    android:viewportHeight="{size}">',
+    ]
+
+    for shape in shapes:
+        cx, cy, r = shape['cx'], shape['cy'], shape['r']
+        if shape['kind'] == 'rect':
+            path_data = f'M0,0h{size}v{size}h-{size}Z'
+        else:
+            path_data = _circle_path(cx, cy, r)
+
+        attrs = [f'android:pathData="{path_data}"']
+        if shape.get('fill'):
+            attrs.append(f'android:fillColor="{argb(shape["fill"])}"')
+        if shape.get('stroke'):
+            color, width = shape['stroke']
+            attrs.append(f'android:strokeColor="{argb(color)}"')
+            attrs.append(f'android:strokeWidth="{_fmt(width)}"')
+
+        if shape.get('gradient'):
+            element = [f'<path {" ".join(attrs)}>',
+                       '    <aapt:attr name="android:fillColor">',
+                       f'        <gradient android:type="radial" android:centerX="{_fmt(cx)}" '
+                       f'android:centerY="{_fmt(cy)}" android:gradientRadius="{_fmt(r)}">']
+            for offset, color in shape['gradient']:
+                element.append(f'            <item android:offset="{_fmt(offset)}" '
+                               f'android:color="{argb(color)}" />')
+            element += ['        </gradient>', '    </aapt:attr>', '</path>']
+        else:
+            element = [f'<path {" ".join(attrs)} />']
+
+        # Clip paths apply to the rest of their group, so each clipped shape gets its own
+        if shape.get('holes'):
+            element = ['<group>',
+                       f'    <clip-path android:pathData="{_clip_path(shape["holes"], size)}" />',
+                       *(f'    {line}' for line in element),
+                       '</group>']
+
+        lines += [f'    {line}' for line in element]
+
+    lines += ['</vector>', '']
+    return '\n'.join(lines)
+
+def adaptive_icon_xml():
+    """The <adaptive-icon> wrapper that ties the three vector layers together"""
+    return '\n'.join([
+        '<?xml version="1.0" encoding="utf-8"?>',
+        '<adaptive-icon xmlns:android="http://schemas.android.com/apk/res/android">',
+        '    <background android:drawable="@drawable/ic_launcher_background" />',
+        '    <foreground android:drawable="@drawable/ic_launcher_foreground" />',
+        '    <monochrome android:drawable="@drawable/ic_launcher_monochrome" />',
+        '</adaptive-icon>',
+        '',
+    ])
+
+def build_layers():
+    """Vector shapes for each adaptive icon layer, keyed by resource name"""
+    return {
+        'ic_launcher_foreground': occlude(foreground_shapes(android_foreground_scene(VIEWPORT))),
+        'ic_launcher_background': occlude(background_shapes(android_background_scene(VIEWPORT))),
+        'ic_launcher_monochrome': occlude(monochrome_shapes(monochrome_scene(VIEWPORT))),
+    }
+
+def export_vectors(output_dir):
+    """Write SVGs, VectorDrawables and adaptive-icon XML under output_dir"""
+    svg_dir = os.path.join(output_dir, 'svg')
+    drawable_dir = os.path.join(output_dir, 'android-vector', 'drawable-anydpi-v26')
+    mipmap_dir = os.path.join(output_dir, 'android-vector', 'mipmap-anydpi-v26')
+    for directory in (svg_dir, drawable_dir, mipmap_dir):
+        os.makedirs(directory, exist_ok=True)
+
+    written = []
+    for name, shapes in build_layers().items():
+        written.append((os.path.join(svg_dir, f'{name}.svg'), to_svg(shapes)))
+        written.append((os.path.join(drawable_dir, f'{name}.xml'), to_vector_drawable(shapes)))
+    for name in ('ic_launcher', 'ic_launcher_round'):
+        written.append((os.path.join(mipmap_dir, f'{name}.xml'), adaptive_icon_xml()))
+
+    for filepath, content in written:
+        with open(filepath, 'w') as output:
+            output.write(content)
+        print(f'✓ Saved {filepath} ({len(content.encode()):,} bytes)')
+
+def vector_drawable_to_svg(xml):
+    """
+    Translate <vector> drawable XML back into an SVG document, reading only the
+    XML (not the shapes it was written from), so --check covers the file that
+    ships in the APK: paths, ARGB colors, aapt:attr radial gradients and
+    <group><clip-path> clips
+    """
+    def attr(element, name, default=None):
+        return element.get(ANDROID_NS + name, default)
+
+    def color(value):
+        """'#AARRGGBB' or '#RRGGBB' -> ('#RRGGBB', opacity)"""
+        digits = value.lstrip('#')
+        alpha = int(digits[:2], 16) if len(digits) == 8 else 255
+        return f'#{digits[-6:]}', _fmt(alpha / 255)
+
+    root = ET.fromstring(xml)
+    width, height = attr(root, 'viewportWidth'), attr(root, 'viewportHeight')
+    defs, ids = [], itertools.count()
+
+    def convert(element):
+        attrs = [f'd="{attr(element, "pathData")}"']
+        gradient = element.find(f"{AAPT_NS}attr[@name='android:fillColor']/gradient")
+        if gradient is not None:
+            if attr(gradient, 'type') != 'radial':
+                raise ValueError(f"unsupported gradient type {attr(gradient, 'type')!r}")
+            stops = []
+            for item in gradient.findall('item'):
+                hex_color, opacity = color(attr(item, 'color'))
+                stops.append(f'<stop offset="{attr(item, "offset")}" stop-color="{hex_color}" '
+                             f'stop-opacity="{opacity}"/>')
+            gradient_id = f'g{next(ids)}'
+            defs.append(f'<radialGradient id="{gradient_id}" gradientUnits="userSpaceOnUse" '
+                        f'cx="{attr(gradient, "centerX")}" cy="{attr(gradient, "centerY")}" '
+                        f'r="{attr(gradient, "gradientRadius")}">{"".join(stops)}</radialGradient>')
+            attrs.append(f'fill="url(#{gradient_id})"')
+        elif attr(element, 'fillColor'):
+            hex_color, opacity = color(attr(element, 'fillColor'))
+            attrs.append(f'fill="{hex_color}" fill-opacity="{opacity}"')
+        else:
+            attrs.append('fill="none"')  # VectorDrawable paths are unfilled by default
+        if attr(element, 'fillType') == 'evenOdd':
+            attrs.append('fill-rule="evenodd"')
+        if attr(element, 'strokeColor'):
+            hex_color, opacity = color(attr(element, 'strokeColor'))
+            attrs.append(f'stroke="{hex_color}" stroke-opacity="{opacity}" '
+                         f'stroke-width="{attr(element, "strokeWidth", "0")}"')
+        return f'<path {" ".join(attrs)}/>'
+
+    def walk(parent):
+        body = []
+        for element in parent:
+            if element.tag == 'path':
+                body.append(convert(element))
+            elif element.tag == 'group':
+                group = walk(element)
+                clip = element.find('clip-path')
+                if clip is not None:
+                    clip_id = f'c{next(ids)}'
+                    defs.append(f'<clipPath id="{clip_id}"><path d="{attr(clip, "pathData")}"/></clipPath>')
+                    group = [f'<g clip-path="url(#{clip_id})">', *group, '</g>']
+                body += group
+            elif element.tag != 'clip-path':
+                raise ValueError(f'unsupported VectorDrawable element <{element.tag}>')
+        return body
+
+    body = walk(root)
+    lines = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}">']
+    if defs:
+        lines += ['<defs>', *defs, '</defs>']
+    lines += [*body, '</svg>', '']
+    return '\n'.join(lines)
+
+def rasterize_svg(svg, size):
+    """Render SVG markup to a PIL image with cairosvg, falling back to resvg-py"""
+    from PIL import Image
+
+    try:
+        import cairosvg
+        png = cairosvg.svg2png(bytestring=svg.encode(), output_width=size, output_height=size)
+    except (ImportError, OSError):
+        try:
+            import resvg_py
+        except ImportError:
+            raise SystemExit('❌ --check needs an SVG rasterizer: pip install cairosvg (or resvg-py)')
+        png = bytes(resvg_py.svg_to_bytes(svg_string=svg, width=size, height=size))
+
+    return Image.open(io.BytesIO(png)).convert('RGBA')
+
+def edge_tolerant_difference(first, second):
+    """
+    Per-pixel max channel difference that lets edges sit 1px apart: each pixel
+    only counts by how far it falls outside the 3x3 range around it in the
+    other image, so antialiasing and rounding at shape edges don't register
+    """
+    from PIL import ImageChops, ImageFilter
+
+    diffs = []
+    for first_band, second_band in zip(first.split(), second.split()):
+        for band, other in ((first_band, second_band), (second_band, first_band)):
+            low = other.filter(ImageFilter.MinFilter(3))
+            high = other.filter(ImageFilter.MaxFilter(3))
+            diffs.append(ImageChops.lighter(ImageChops.subtract(low, band),
+                                            ImageChops.subtract(band, high)))
+    return functools.reduce(ImageChops.lighter, diffs)
+
+def check_vectors(size=VIEWPORT, tolerance=CHECK_TOLERANCE):
+    """
+    Compare each layer's SVG and VectorDrawable with the PNG renderer; return
+    True if at most `tolerance` % of pixels differ by more than CHECK_THRESHOLD
+    """
+    from generate_android_adaptive_icons import (create_android_adaptive_background,
+                                                 create_android_adaptive_foreground)
+    from generate_monochrome_icon import create_monochrome_icon
+
+    renderers = {
+        'ic_launcher_foreground': create_android_adaptive_foreground,
+        'ic_launcher_background': create_android_adaptive_background,
+        'ic_launcher_monochrome': create_monochrome_icon,
+    }
+
+    passed = True
+    for name, shapes in build_layers().items():
+        # Compare premultiplied so invisible color under alpha 0 does not count.
+        # Counting mismatched pixels (not averaging) keeps a missing shape from
+        # hiding among the transparent pixels of a mostly empty layer
+        raster = renderers[name](size).convert('RGBA').convert('RGBa')
+        outputs = {
+            f'{name}.svg': to_svg(shapes),
+            f'{name}.xml': vector_drawable_to_svg(to_vector_drawable(shapes)),
+        }
+        for label, svg in outputs.items():
+            vector = rasterize_svg(svg, size).convert('RGBa')
+            diff = edge_tolerant_difference(raster, vector)
+            mismatched = sum(diff.histogram()[CHECK_THRESHOLD + 1:]) / (size * size) * 100
+            ok = mismatched <= tolerance
+            passed &= ok
+            print(f"{'✓' if ok else '✗'} {label}: {mismatched:.3f}% of pixels off by more than "
+                  f"{CHECK_THRESHOLD}, max difference {diff.getextrema()[1]} (tolerance {tolerance}%)")
+
+    return passed
+
+def main():
+    """Export vector icons and optionally verify them against the rasters"""
+    parser = argparse.ArgumentParser(description='Export adaptive icon layers as SVG and VectorDrawable')
+    parser.add_argument('--out', default=os.path.join(ICONS_ROOT, 'v1-orbital-alignment'),
+                        help='version directory to write svg/ and android-vector/ into')
+    parser.add_argument('--check', action='store_true',
+                        help='compare the rasterized SVGs and VectorDrawables with the PNG renderer output')
+    parser.add_argument('--tolerance', type=float, default=CHECK_TOLERANCE,
+                        help=f'max %% of mismatched pixels for --check (default: {CHECK_TOLERANCE})')
+    args = parser.parse_args()
+
+    print("🎨 Exporting vector icons...")
+    export_vectors(args.out)
+
+    if args.check:
+        print("\n🔍 Comparing vector and raster renders...")
+        if not check_vectors(tolerance=args.tolerance):
+            raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
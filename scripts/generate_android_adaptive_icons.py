@@ -5,8 +5,12 @@ Creates foreground and background layers for adaptive icon system
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+import math
 import os
 
+from generate_app_icons import resample_rings
+from icon_variants import ICONS_ROOT
+
 def create_gradient_background(size, colors):
     """Create a radial gradient background"""
     image = Image.new('RGB', (size, size))
@@ -35,39 +39,28 @@ def create_gradient_background(size, colors):
 
     return image
 
-def create_android_adaptive_foreground(size=1024):
+def android_foreground_scene(size=1024, safe_scale=0.80, ring_count=3, node_colors=None):
     """
-    Create foreground layer for Android adaptive icon
-    This will be overlaid on the background and can be masked to any shape
-    Safe zone: Center 66% (avoid outer 17% on each side)
+    Geometry of the adaptive foreground (rings, nodes, core) in pixels
+    Shared by the PNG renderer and the vector exporter so they never drift
     """
-
-    # Create transparent image
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
     center = size // 2
 
     # Scale everything to fit within safe zone (center 66%)
     # Android adaptive icons have a safe zone of 66dp out of 108dp
-    # Using 0.80 to fill more space and reduce background visibility
-    safe_scale = 0.80
-
-    # Draw three orbital rings (scaled for safe zone)
-    ring_radii = [size * 0.28 * safe_scale, size * 0.20 * safe_scale, size * 0.13 * safe_scale]
-    ring_widths = [int(size * 0.018), int(size * 0.020), int(size * 0.022)]
-    ring_colors = [
-        (255, 255, 255, 60),   # Outer ring (more opaque for visibility)
-        (220, 180, 255, 90),   # Middle ring
-        (255, 220, 255, 110)   # Inner ring (brightest)
-    ]
-
-    for radius, width, color in zip(ring_radii, ring_widths, ring_colors):
-        draw.ellipse([center - radius, center - radius,
-                      center + radius, center + radius],
-                     outline=color, width=width)
-
-    # Draw orbital nodes (4 points representing active tasks)
-    import math
+    # safe_scale defaults to 0.80 to fill more space and reduce background visibility
+
+    # Three orbital rings (scaled for safe zone)
+    rings = resample_rings([
+        (0.28, 0.018, (255, 255, 255, 60)),   # Outer ring (more opaque for visibility)
+        (0.20, 0.020, (220, 180, 255, 90)),   # Middle ring
+        (0.13, 0.022, (255, 220, 255, 110))   # Inner ring (brightest)
+    ], ring_count)
+    ring_radii = [size * radius * safe_scale for radius, _, _ in rings]
+    ring_widths = [int(size * width) for _, width, _ in rings]
+    ring_colors = [color for _, _, color in rings]
+
+    # Orbital nodes (4 points representing active tasks)
     node_positions = [
         (center + ring_radii[0] * math.cos(math.radians(45)),
          center + ring_radii[0] * math.sin(math.radians(45))),
@@ -79,16 +72,50 @@ def create_android_adaptive_foreground(size=1024):
          center + ring_radii[0] * math.sin(math.radians(315)))
     ]
 
-    node_colors = [
-        (255, 180, 100),  # Orange
-        (150, 200, 255),  # Blue
-        (255, 150, 200),  # Pink
-        (180, 255, 200)   # Cyan
-    ]
+    if node_colors is None:
+        node_colors = [
+            (255, 180, 100),  # Orange
+            (150, 200, 255),  # Blue
+            (255, 150, 200),  # Pink
+            (180, 255, 200)   # Cyan
+        ]
+
+    return {
+        'center': center,
+        'rings': list(zip(ring_radii, ring_widths, ring_colors)),
+        'nodes': list(zip(node_positions, node_colors)),
+        'node_radius': size * 0.04 * safe_scale,
+        'core_radius': size * 0.065 * safe_scale,
+        'core_glow_color': (255, 200, 255),
+        'core_inner_color': (200, 100, 255),
+        'core_outer_color': (255, 150, 255),
+    }
+
+def create_android_adaptive_foreground(size=1024, safe_scale=0.80, ring_count=3, node_colors=None):
+    """
+    Create foreground layer for Android adaptive icon
+    This will be overlaid on the background and can be masked to any shape
+    Safe zone: Center 66% (avoid outer 17% on each side)
+    Keyword arguments override the design for parameter sweeps
+    """
+
+    scene = android_foreground_scene(size, safe_scale, ring_count, node_colors)
 
-    node_radius = size * 0.04 * safe_scale
+    # Create transparent image
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    center = scene['center']
 
-    for (x, y), color in zip(node_positions, node_colors):
+    # Draw orbital rings
+    for radius, width, color in scene['rings']:
+        draw.ellipse([center - radius, center - radius,
+                      center + radius, center + radius],
+                     outline=color, width=width)
+
+    # Draw orbital nodes
+    node_radius = scene['node_radius']
+
+    for (x, y), color in scene['nodes']:
         # Draw node with gradient
         for i in range(int(node_radius), 0, -1):
             alpha = int(255 * (i / node_radius))
@@ -96,45 +123,69 @@ def create_android_adaptive_foreground(size=1024):
                         fill=(*color, alpha))
 
     # Draw central core (the user's primary focus)
-    core_radius = size * 0.065 * safe_scale
+    core_radius = scene['core_radius']
 
     # Outer glow
     for i in range(int(core_radius * 1.8), int(core_radius), -1):
         alpha = int(80 * ((core_radius * 1.8 - i) / (core_radius * 0.8)))
         draw.ellipse([center - i, center - i, center + i, center + i],
-                    fill=(255, 200, 255, alpha))
+                    fill=(*scene['core_glow_color'], alpha))
 
     # Main core with gradient
+    inner, outer = scene['core_inner_color'], scene['core_outer_color']
     for i in range(int(core_radius), 0, -1):
         ratio = i / core_radius
-        r = int(255 * ratio + 200 * (1 - ratio))
-        g = int(150 * ratio + 100 * (1 - ratio))
-        b = int(255 * ratio + 255 * (1 - ratio))
+        r = int(outer[0] * ratio + inner[0] * (1 - ratio))
+        g = int(outer[1] * ratio + inner[1] * (1 - ratio))
+        b = int(outer[2] * ratio + inner[2] * (1 - ratio))
         draw.ellipse([center - i, center - i, center + i, center + i],
                     fill=(r, g, b, 255))
 
     return img
 
+def android_background_scene(size=1024):
+    """
+    Gradient stops and sparkles of the adaptive background in pixels
+    Shared by the PNG renderer and the vector exporter
+    """
+    return {
+        'center': size // 2,
+        # Radial gradient from center to corners
+        'max_radius': int((size ** 2 + size ** 2) ** 0.5),  # Diagonal distance to fill all corners
+        # Color scheme: Deep space purple to vibrant purple
+        'colors': [
+            (140, 60, 180),    # Brighter purple (center)
+            (90, 45, 130),     # Medium purple
+            (50, 25, 80)       # Deep purple (edges)
+        ],
+        # Sparkle effect (small stars) - more subtle
+        'sparkles': [
+            (size * 0.20, size * 0.15),
+            (size * 0.80, size * 0.22),
+            (size * 0.18, size * 0.78),
+            (size * 0.85, size * 0.82),
+            (size * 0.50, size * 0.10),
+            (size * 0.90, size * 0.50)
+        ],
+        'sparkle_radius': size * 0.010,
+        'sparkle_color': (255, 255, 255, 140),
+    }
+
 def create_android_adaptive_background(size=1024):
     """
     Create background layer for Android adaptive icon
     This provides the cosmic purple gradient filling the entire area
     """
 
+    scene = android_background_scene(size)
+
     # Create full-size gradient that fills entire square
     img = Image.new('RGB', (size, size))
     draw = ImageDraw.Draw(img)
 
-    # Fill with radial gradient from center to corners
-    center_x, center_y = size // 2, size // 2
-    max_radius = int((size ** 2 + size ** 2) ** 0.5)  # Diagonal distance to fill all corners
-
-    # Color scheme: Deep space purple to vibrant purple
-    colors = [
-        (140, 60, 180),    # Brighter purple (center)
-        (90, 45, 130),     # Medium purple
-        (50, 25, 80)       # Deep purple (edges)
-    ]
+    center_x = center_y = scene['center']
+    max_radius = scene['max_radius']
+    colors = scene['colors']
 
     for i in range(max_radius, 0, -1):
         ratio = i / max_radius
@@ -166,31 +217,35 @@ def create_android_adaptive_background(size=1024):
     img = img.convert('RGBA')
     draw = ImageDraw.Draw(img)
 
-    # Add sparkle effect (small stars) - more subtle
-    sparkle_positions = [
-        (size * 0.20, size * 0.15),
-        (size * 0.80, size * 0.22),
-        (size * 0.18, size * 0.78),
-        (size * 0.85, size * 0.82),
-        (size * 0.50, size * 0.10),
-        (size * 0.90, size * 0.50)
-    ]
-
-    for x, y in sparkle_positions:
-        sparkle_size = size * 0.010
+    # Add sparkle effect (small stars)
+    sparkle_size = scene['sparkle_radius']
+    for x, y in scene['sparkles']:
         draw.ellipse([x - sparkle_size, y - sparkle_size,
                      x + sparkle_size, y + sparkle_size],
-                    fill=(255, 255, 255, 140))
+                    fill=scene['sparkle_color'])
 
     return img
 
-def main():
+def create_adaptive_preview(background, foreground):
+    """Composite the two layers and apply a circle mask (how it looks on Android)"""
+    size = background.size[0]
+    preview = Image.alpha_composite(background, foreground)
+
+    # Apply circle mask for preview
+    mask = Image.new('L', (size, size), 0)
+    mask_draw = ImageDraw.Draw(mask)
+    mask_draw.ellipse([0, 0, size - 1, size - 1], fill=255)
+    preview.putalpha(mask)
+
+    return preview
+
+def main(output_dir=None):
     """Generate Android adaptive icon layers"""
 
     print("🎨 Generating Android Adaptive Icons...")
     print("=" * 60)
 
-    output_dir = '/Users/sammuthu/Projects/cosmicboard/app-icons/v1-orbital-alignment/android-adaptive'
+    output_dir = output_dir or os.path.join(ICONS_ROOT, 'v1-orbital-alignment', 'android-adaptive')
     os.makedirs(output_dir, exist_ok=True)
 
     # Generate foreground layer (1024x1024)
@@ -209,21 +264,10 @@ def main():
 
     # Create preview (composite)
     print("\n🔍 Creating preview...")
-    preview = Image.new('RGBA', (1024, 1024), (0, 0, 0, 0))
-    preview.paste(background, (0, 0))
-    preview = Image.alpha_composite(preview, foreground)
-
-    # Apply circle mask for preview
-    mask = Image.new('L', (1024, 1024), 0)
-    mask_draw = ImageDraw.Draw(mask)
-    mask_draw.ellipse([0, 0, 1023, 1023], fill=255)
-
-    preview_circle = Image.new('RGBA', (1024, 1024), (0, 0, 0, 0))
-    preview_circle.paste(preview, (0, 0))
-    preview_circle.putalpha(mask)
+    preview = create_adaptive_preview(background, foreground)
 
     preview_path = os.path.join(output_dir, 'preview_circle.png')
-    preview_circle.save(preview_path, 'PNG')
+    preview.save(preview_path, 'PNG')
     print(f"✓ Saved: {preview_path}")
 
     print("\n" + "=" * 60)
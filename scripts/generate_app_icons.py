@@ -8,12 +8,17 @@ Creates high-quality app icons for iOS and Android that represent:
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import nullcontext
+from functools import lru_cache
 import math
 import os
 
+from icon_variants import ICONS_ROOT
+
 def create_gradient_background(size, colors):
-    """Create a radial gradient background"""
-    image = Image.new('RGB', (size, size))
+    """Create a radial gradient background (opaque RGBA, ready for compositing)"""
+    image = Image.new('RGBA', (size, size), (0, 0, 0, 255))
     draw = ImageDraw.Draw(image)
 
     center_x, center_y = size // 2, size // 2
@@ -43,7 +48,7 @@ def create_gradient_background(size, colors):
     return image
 
 def add_glow(image, glow_color, intensity=30):
-    """Add a subtle glow effect"""
+    """Add a subtle glow effect (composited in place when image is already RGBA)"""
     glow = Image.new('RGBA', image.size, (0, 0, 0, 0))
     draw = ImageDraw.Draw(glow)
 
@@ -54,18 +59,57 @@ def add_glow(image, glow_color, intensity=30):
                   center + radius, center + radius],
                  fill=(*glow_color, intensity))
 
-    glow = glow.filter(ImageFilter.GaussianBlur(radius=40))
-    image = Image.alpha_composite(image.convert('RGBA'), glow)
+    # Blur radius is 40px at the 1024px master; scale it so previews match
+    glow = glow.filter(ImageFilter.GaussianBlur(radius=40 * image.size[0] / 1024))
+    if image.mode != 'RGBA':
+        image = image.convert('RGBA')
+    image.alpha_composite(glow)
 
     return image
 
-def create_cosmicboard_icon_v1(size=1024):
+@lru_cache(maxsize=32)
+def _cached_backdrop(size, bg_colors, glow_color, intensity):
+    img = create_gradient_background(size, bg_colors)
+    return add_glow(img, glow_color, intensity=intensity)
+
+def create_backdrop(size, bg_colors, glow_color, intensity):
+    """
+    Gradient background with glow, shared by all renders that use the same
+    colors and intensity (parameter sweeps hit this cache constantly)
+    Returns a fresh copy that is safe to draw on
+    """
+    return _cached_backdrop(size, tuple(bg_colors), glow_color, intensity).copy()
+
+def resample_rings(rings, count):
+    """
+    Spread `count` rings evenly between the outermost and innermost ring spec
+    Each spec is a tuple of size factors and/or RGBA colors; the specs are
+    returned unchanged when the count already matches
+    """
+    if count < 1:
+        raise ValueError(f'ring_count must be at least 1, got {count}')
+    if count == len(rings):
+        return list(rings)
+    if count == 1:
+        return [rings[0]]
+
+    def lerp(a, b, t):
+        if isinstance(a, tuple):
+            return tuple(round(x + (y - x) * t) for x, y in zip(a, b))
+        return a + (b - a) * t
+
+    outer, inner = rings[0], rings[-1]
+    return [tuple(lerp(a, b, step / (count - 1)) for a, b in zip(outer, inner))
+            for step in range(count)]
+
+def create_cosmicboard_icon_v1(size=1024, ring_count=3, node_colors=None, glow_intensity=20):
     """
     Version 1: Orbital Alignment Icon
     - Central glowing core (user's primary goal)
     - Three orbital rings (projects at different priorities)
     - Four orbital nodes (active tasks/projects)
     - Clean, modern, scales perfectly
+    Keyword arguments override the design for parameter sweeps
     """
 
     # Color scheme: Deep space purple to vibrant pink/cyan
@@ -75,24 +119,21 @@ def create_cosmicboard_icon_v1(size=1024):
         (140, 60, 180)     # Brighter purple (center)
     ]
 
-    # Create background
-    img = create_gradient_background(size, bg_colors)
-    img = img.convert('RGBA')
-
-    # Add subtle glow
-    img = add_glow(img, (180, 100, 255), intensity=20)
+    # Create background with subtle glow
+    img = create_backdrop(size, bg_colors, (180, 100, 255), glow_intensity)
 
     draw = ImageDraw.Draw(img)
     center = size // 2
 
     # Draw three orbital rings (representing project layers)
-    ring_radii = [size * 0.38, size * 0.28, size * 0.18]
-    ring_widths = [int(size * 0.015), int(size * 0.018), int(size * 0.020)]
-    ring_colors = [
-        (255, 255, 255, 40),   # Outer ring (subtle)
-        (200, 150, 255, 60),   # Middle ring
-        (255, 200, 255, 80)    # Inner ring (brightest)
-    ]
+    rings = resample_rings([
+        (0.38, 0.015, (255, 255, 255, 40)),   # Outer ring (subtle)
+        (0.28, 0.018, (200, 150, 255, 60)),   # Middle ring
+        (0.18, 0.020, (255, 200, 255, 80))    # Inner ring (brightest)
+    ], ring_count)
+    ring_radii = [size * radius for radius, _, _ in rings]
+    ring_widths = [int(size * width) for _, width, _ in rings]
+    ring_colors = [color for _, _, color in rings]
 
     for radius, width, color in zip(ring_radii, ring_widths, ring_colors):
         draw.ellipse([center - radius, center - radius,
@@ -111,12 +152,13 @@ def create_cosmicboard_icon_v1(size=1024):
          center + ring_radii[0] * math.sin(math.radians(315)))
     ]
 
-    node_colors = [
-        (255, 180, 100),  # Orange (Supernova)
-        (150, 200, 255),  # Blue (Stellar)
-        (255, 150, 200),  # Pink
-        (180, 255, 200)   # Cyan
-    ]
+    if node_colors is None:
+        node_colors = [
+            (255, 180, 100),  # Orange (Supernova)
+            (150, 200, 255),  # Blue (Stellar)
+            (255, 150, 200),  # Pink
+            (180, 255, 200)   # Cyan
+        ]
 
     node_radius = size * 0.035
 
@@ -163,7 +205,7 @@ def create_cosmicboard_icon_v1(size=1024):
 
     return img
 
-def create_cosmicboard_icon_v2(size=1024):
+def create_cosmicboard_icon_v2(size=1024, glow_intensity=25):
     """
     Version 2: Network Constellation Icon
     - Interconnected nodes forming a constellation
@@ -178,9 +220,7 @@ def create_cosmicboard_icon_v2(size=1024):
         (100, 50, 140)     # Rich purple
     ]
 
-    img = create_gradient_background(size, bg_colors)
-    img = img.convert('RGBA')
-    img = add_glow(img, (150, 80, 200), intensity=25)
+    img = create_backdrop(size, bg_colors, (150, 80, 200), glow_intensity)
 
     draw = ImageDraw.Draw(img)
     center = size // 2
@@ -251,7 +291,7 @@ def create_cosmicboard_icon_v2(size=1024):
 
     return img
 
-def create_cosmicboard_icon_v3(size=1024):
+def create_cosmicboard_icon_v3(size=1024, glow_intensity=22):
     """
     Version 3: Minimal Cosmic Compass
     - Clean circular design with directional markers
@@ -266,9 +306,7 @@ def create_cosmicboard_icon_v3(size=1024):
         (120, 55, 160)
     ]
 
-    img = create_gradient_background(size, bg_colors)
-    img = img.convert('RGBA')
-    img = add_glow(img, (160, 90, 220), intensity=22)
+    img = create_backdrop(size, bg_colors, (160, 90, 220), glow_intensity)
 
     draw = ImageDraw.Draw(img)
     center = size // 2
@@ -354,7 +392,7 @@ def create_cosmicboard_icon_v3(size=1024):
     return img
 
 def apply_ios_shape(img, size):
-    """Apply iOS squircle shape mask"""
+    """Apply iOS squircle shape mask (in place; pass an image you own)"""
     # Create a mask with rounded corners (iOS style)
     mask = Image.new('L', (size, size), 0)
     draw = ImageDraw.Draw(mask)
@@ -364,15 +402,38 @@ def apply_ios_shape(img, size):
     draw.rounded_rectangle([0, 0, size - 1, size - 1],
                           radius=corner_radius, fill=255)
 
-    # Apply mask
-    output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    output.paste(img, (0, 0))
-    output.putalpha(mask)
+    # Apply mask as the alpha channel
+    img.putalpha(mask)
+
+    return img
+
+def _save_resized(base_img, size, filepath, ios_shape):
+    """Resize the master to one icon size and save it"""
+    resized = base_img.resize((size, size), Image.Resampling.LANCZOS)
+
+    if ios_shape:
+        # Apply iOS shape to smaller icons
+        apply_ios_shape(resized, size)
+
+    resized.save(filepath, 'PNG', quality=100)
+    return filepath
 
-    return output
+def _save_resized_from_buffer(handle, size, filepath, ios_shape):
+    """Worker: resize straight from the shared-memory master instead of a pickled copy"""
+    from icon_buffers import IconBuffer
 
-def save_icon_set(base_img, output_dir, platform='ios'):
-    """Save icons in all required sizes for the platform"""
+    master = IconBuffer.attach(handle)
+    view = master.image()
+    try:
+        return _save_resized(view, size, filepath, ios_shape)
+    finally:
+        # Close the view explicitly: if the save raised, the traceback still
+        # references it, and the buffer can't be closed while it is mapped
+        view.close()
+        master.close()
+
+def icon_set_tasks(output_dir, platform='ios', only_sizes=None):
+    """Create output_dir and return (size, filepath, ios_shape) for each icon of the platform"""
 
     if platform == 'ios':
         sizes = {
@@ -396,56 +457,80 @@ def save_icon_set(base_img, output_dir, platform='ios'):
             '48': 48,        # mdpi
         }
 
+    if only_sizes is not None:
+        sizes = {name: size for name, size in sizes.items() if size in only_sizes}
+
     os.makedirs(output_dir, exist_ok=True)
 
-    for name, size in sizes.items():
-        resized = base_img.resize((size, size), Image.Resampling.LANCZOS)
+    return [(size, os.path.join(output_dir, f'icon-{name}.png'), platform == 'ios' and size < 1024)
+            for name, size in sizes.items()]
+
+def save_icon_set(base_img, output_dir, platform='ios', only_sizes=None):
+    """Save icons in all required sizes for the platform (or just only_sizes) and return their paths"""
+    saved = [_save_resized(base_img, *task) for task in icon_set_tasks(output_dir, platform, only_sizes)]
+    for filepath in saved:
+        print(f'✓ Saved {filepath}')
+    return saved
 
-        if platform == 'ios' and size < 1024:
-            # Apply iOS shape to smaller icons
-            resized = apply_ios_shape(resized, size)
+def _save_in_workers(base_img, tasks, executor):
+    """Resize in the executor's workers, which all read one shared-memory copy of the master"""
+    from icon_buffers import IconBuffer
 
-        filename = f'icon-{name}.png'
-        filepath = os.path.join(output_dir, filename)
-        resized.save(filepath, 'PNG', quality=100)
+    with IconBuffer.from_image(base_img) as master:
+        futures = [executor.submit(_save_resized_from_buffer, master.handle, *task) for task in tasks]
+        # Keep the master alive until every worker is done with it, even if one fails
+        wait(futures)
+    return [future.result() for future in futures]
+
+def save_version(icon, version_dir, only_sizes=None, executor=None):
+    """
+    Save the 1024px preview plus the iOS and Android icon sets; return the paths.
+    With an executor (one pool for the whole run), both sets are resized in its workers
+    """
+    os.makedirs(version_dir, exist_ok=True)
+    saved = []
+    if only_sizes is None or 1024 in only_sizes:
+        preview_path = os.path.join(version_dir, 'preview-1024.png')
+        icon.save(preview_path, 'PNG', quality=100)
+        saved.append(preview_path)
+
+    if executor is None:
+        saved += save_icon_set(icon, os.path.join(version_dir, 'ios'), 'ios', only_sizes)
+        saved += save_icon_set(icon, os.path.join(version_dir, 'android'), 'android', only_sizes)
+        return saved
+
+    tasks = (icon_set_tasks(os.path.join(version_dir, 'ios'), 'ios', only_sizes)
+             + icon_set_tasks(os.path.join(version_dir, 'android'), 'android', only_sizes))
+    resized = _save_in_workers(icon, tasks, executor)
+    for filepath in resized:
         print(f'✓ Saved {filepath}')
+    return saved + resized
 
-def main():
-    """Generate all app icon variations"""
+def main(output_base=None, jobs=1):
+    """Generate all app icon variations (jobs > 1 resizes them in one shared worker pool)"""
 
     print("🎨 Generating CosmicBoard App Icons...")
     print("=" * 60)
 
     # Create output directory
-    output_base = '/Users/sammuthu/Projects/cosmicboard/app-icons'
+    output_base = output_base or ICONS_ROOT
     os.makedirs(output_base, exist_ok=True)
 
-    # Generate Version 1: Orbital Alignment
-    print("\n📍 Version 1: Orbital Alignment (Recommended)")
-    icon_v1 = create_cosmicboard_icon_v1(1024)
-    v1_dir = os.path.join(output_base, 'v1-orbital-alignment')
-    os.makedirs(v1_dir, exist_ok=True)
-    icon_v1.save(os.path.join(v1_dir, 'preview-1024.png'), 'PNG', quality=100)
-    save_icon_set(icon_v1, os.path.join(v1_dir, 'ios'), 'ios')
-    save_icon_set(icon_v1, os.path.join(v1_dir, 'android'), 'android')
-
-    # Generate Version 2: Network Constellation
-    print("\n🌐 Version 2: Network Constellation")
-    icon_v2 = create_cosmicboard_icon_v2(1024)
-    v2_dir = os.path.join(output_base, 'v2-network-constellation')
-    os.makedirs(v2_dir, exist_ok=True)
-    icon_v2.save(os.path.join(v2_dir, 'preview-1024.png'), 'PNG', quality=100)
-    save_icon_set(icon_v2, os.path.join(v2_dir, 'ios'), 'ios')
-    save_icon_set(icon_v2, os.path.join(v2_dir, 'android'), 'android')
-
-    # Generate Version 3: Cosmic Compass
-    print("\n🧭 Version 3: Cosmic Compass (Most Minimal)")
-    icon_v3 = create_cosmicboard_icon_v3(1024)
-    v3_dir = os.path.join(output_base, 'v3-cosmic-compass')
-    os.makedirs(v3_dir, exist_ok=True)
-    icon_v3.save(os.path.join(v3_dir, 'preview-1024.png'), 'PNG', quality=100)
-    save_icon_set(icon_v3, os.path.join(v3_dir, 'ios'), 'ios')
-    save_icon_set(icon_v3, os.path.join(v3_dir, 'android'), 'android')
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else nullcontext() as executor:
+        # Generate Version 1: Orbital Alignment
+        print("\n📍 Version 1: Orbital Alignment (Recommended)")
+        icon_v1 = create_cosmicboard_icon_v1(1024)
+        save_version(icon_v1, os.path.join(output_base, 'v1-orbital-alignment'), executor=executor)
+
+        # Generate Version 2: Network Constellation
+        print("\n🌐 Version 2: Network Constellation")
+        icon_v2 = create_cosmicboard_icon_v2(1024)
+        save_version(icon_v2, os.path.join(output_base, 'v2-network-constellation'), executor=executor)
+
+        # Generate Version 3: Cosmic Compass
+        print("\n🧭 Version 3: Cosmic Compass (Most Minimal)")
+        icon_v3 = create_cosmicboard_icon_v3(1024)
+        save_version(icon_v3, os.path.join(output_base, 'v3-cosmic-compass'), executor=executor)
 
     print("\n" + "=" * 60)
     print("✨ Icon generation complete!")
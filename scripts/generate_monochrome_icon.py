@@ -3,29 +3,27 @@
 
 from PIL import Image, ImageDraw
 import math
+import os
 
-def create_monochrome_icon(size=1024):
-    """Create white monochrome version for Android themed icons"""
+from generate_app_icons import resample_rings
+from icon_variants import ICONS_ROOT
 
-    # Transparent background
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+def monochrome_scene(size=1024, safe_scale=0.80, ring_count=3):
+    """
+    Geometry of the monochrome icon (rings, nodes, core) in pixels
+    Shared by the PNG renderer and the vector exporter
+    """
     center = size // 2
 
     # Scale for safe zone
-    # Using 0.80 to fill more space and reduce background visibility
-    safe_scale = 0.80
+    # safe_scale defaults to 0.80 to fill more space and reduce background visibility
 
-    # Draw orbital rings (white only)
-    ring_radii = [size * 0.28 * safe_scale, size * 0.20 * safe_scale, size * 0.13 * safe_scale]
-    ring_widths = [int(size * 0.018), int(size * 0.020), int(size * 0.022)]
+    # Orbital rings
+    rings = resample_rings([(0.28, 0.018), (0.20, 0.020), (0.13, 0.022)], ring_count)
+    ring_radii = [size * radius * safe_scale for radius, _ in rings]
+    ring_widths = [int(size * width) for _, width in rings]
 
-    for radius, width in zip(ring_radii, ring_widths):
-        draw.ellipse([center - radius, center - radius,
-                      center + radius, center + radius],
-                     outline=(255, 255, 255, 255), width=width)
-
-    # Draw orbital nodes
+    # Orbital nodes
     node_positions = [
         (center + ring_radii[0] * math.cos(math.radians(45)),
          center + ring_radii[0] * math.sin(math.radians(45))),
@@ -37,23 +35,54 @@ def create_monochrome_icon(size=1024):
          center + ring_radii[0] * math.sin(math.radians(315)))
     ]
 
-    node_radius = size * 0.04 * safe_scale
+    return {
+        'center': center,
+        'rings': list(zip(ring_radii, ring_widths)),
+        'nodes': node_positions,
+        'node_radius': size * 0.04 * safe_scale,
+        'core_radius': size * 0.065 * safe_scale,
+    }
+
+def create_monochrome_icon(size=1024, safe_scale=0.80, ring_count=3):
+    """Create white monochrome version for Android themed icons"""
+
+    scene = monochrome_scene(size, safe_scale, ring_count)
 
-    for (x, y) in node_positions:
+    # Transparent background
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
+    center = scene['center']
+
+    # Draw orbital rings (white only)
+    for radius, width in scene['rings']:
+        draw.ellipse([center - radius, center - radius,
+                      center + radius, center + radius],
+                     outline=(255, 255, 255, 255), width=width)
+
+    # Draw orbital nodes
+    node_radius = scene['node_radius']
+
+    for (x, y) in scene['nodes']:
         draw.ellipse([x - node_radius, y - node_radius,
                       x + node_radius, y + node_radius],
                     fill=(255, 255, 255, 255))
 
     # Draw central core
-    core_radius = size * 0.065 * safe_scale
+    core_radius = scene['core_radius']
     draw.ellipse([center - core_radius, center - core_radius,
                   center + core_radius, center + core_radius],
                 fill=(255, 255, 255, 255))
 
     return img
 
-# Generate and save
-output_path = '/Users/sammuthu/Projects/cosmicboard/app-icons/v1-orbital-alignment/android-adaptive/ic_launcher_monochrome.png'
-icon = create_monochrome_icon(1024)
-icon.save(output_path, 'PNG')
-print(f"✓ Generated monochrome icon: {output_path}")
+def main(output_path=None):
+    """Generate and save the monochrome icon"""
+    output_path = output_path or os.path.join(
+        ICONS_ROOT, 'v1-orbital-alignment', 'android-adaptive', 'ic_launcher_monochrome.png')
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    icon = create_monochrome_icon(1024)
+    icon.save(output_path, 'PNG')
+    print(f"✓ Generated monochrome icon: {output_path}")
+
+if __name__ == '__main__':
+    main()
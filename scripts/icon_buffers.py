@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Shared-memory image buffers for the icon pipeline
+An IconBuffer keeps RGBA pixels in a multiprocessing.shared_memory block and
+exposes them as a NumPy array and as a zero-copy Pillow image. Worker
+processes attach by name instead of receiving pickled frames.
+
+Pillow copies buffer-backed images before drawing on them, so drawing
+stages still render into their own images. A finished frame is written in
+once, and everything downstream (resizes, workers, contact sheets) reads it
+in place. That saves inter-process traffic rather than memory: the shared
+copy sits alongside the frame it was written from.
+"""
+
+from multiprocessing import shared_memory
+from PIL import Image
+import numpy as np
+
+class IconBuffer:
+    """RGBA pixels in shared memory, viewable as NumPy and Pillow without copies"""
+
+    def __init__(self, shm, width, height, owner):
+        self.shm = shm
+        self.width = width
+        self.height = height
+        self.owner = owner
+        self._array = None
+
+    @classmethod
+    def create(cls, width, height):
+        """Allocate a zeroed (fully transparent) buffer owned by this process"""
+        shm = shared_memory.SharedMemory(create=True, size=width * height * 4)
+        return cls(shm, width, height, owner=True)
+
+    @classmethod
+    def from_image(cls, img):
+        """Allocate a buffer holding a copy of img's pixels (the only copy made)"""
+        buffer = cls.create(*img.size)
+        buffer.write(img)
+        return buffer
+
+    @classmethod
+    def attach(cls, handle):
+        """Attach to a buffer created in another process from its handle"""
+        name, width, height = handle
+        return cls(shared_memory.SharedMemory(name=name), width, height, owner=False)
+
+    @property
+    def handle(self):
+        """Small picklable reference to pass to worker processes"""
+        return (self.shm.name, self.width, self.height)
+
+    @property
+    def array(self):
+        """(height, width, 4) uint8 view of the shared pixels"""
+        if self._array is None:
+            self._array = np.ndarray((self.height, self.width, 4), dtype=np.uint8,
+                                     buffer=self.shm.buf)
+        return self._array
+
+    def image(self, top=0, height=None):
+        """
+        Read-only Pillow view of the pixels (or of `height` rows from `top`),
+        sharing memory with the buffer; close() the view before closing the buffer
+        """
+        height = self.height - top if height is None else height
+        start = top * self.width * 4
+        rows = self.shm.buf[start:start + height * self.width * 4]
+        return Image.frombuffer('RGBA', (self.width, height), rows, 'raw', 'RGBA', 0, 1)
+
+    def write(self, img, top=0):
+        """Copy an image's pixels into the buffer starting at row `top`"""
+        pixels = np.asarray(img.convert('RGBA') if img.mode != 'RGBA' else img)
+        self.array[top:top + pixels.shape[0], :pixels.shape[1]] = pixels
+
+    def close(self):
+        """Detach from the shared memory; the owner also frees it"""
+        self._array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+CosmicBoard icon variant registry
+Maps each renderable icon variant to the generator function that draws it,
+so tooling can load a variant without hard-coding module names.
+"""
+
+import importlib
+import os
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+ICONS_ROOT = os.path.join(os.path.dirname(SCRIPTS_DIR), 'app-icons')
+
+# variant name -> (generator module, render function)
+VARIANTS = {
+    'v1-orbital-alignment': ('generate_app_icons', 'create_cosmicboard_icon_v1'),
+    'v2-network-constellation': ('generate_app_icons', 'create_cosmicboard_icon_v2'),
+    'v3-cosmic-compass': ('generate_app_icons', 'create_cosmicboard_icon_v3'),
+    'android-foreground': ('generate_android_adaptive_icons', 'create_android_adaptive_foreground'),
+    'android-background': ('generate_android_adaptive_icons', 'create_android_adaptive_background'),
+    'android-monochrome': ('generate_monochrome_icon', 'create_monochrome_icon'),
+}
+
+# Variants that are single adaptive icon layers rather than full icon sets,
+# with their output path relative to the icons root
+ADAPTIVE_LAYERS = {
+    'android-foreground': 'v1-orbital-alignment/android-adaptive/ic_launcher_foreground.png',
+    'android-background': 'v1-orbital-alignment/android-adaptive/ic_launcher_background.png',
+    'android-monochrome': 'v1-orbital-alignment/android-adaptive/ic_launcher_monochrome.png',
+}
+
+# Module the other generators import shared helpers from
+BASE_MODULE = 'generate_app_icons'
+
+def variant_source_path(name):
+    """Return the path of the generator script that defines a variant"""
+    module_name, _ = VARIANTS[name]
+    return os.path.join(SCRIPTS_DIR, f'{module_name}.py')
+
+def variant_source_paths(name):
+    """Return every generator script a variant's rendering depends on"""
+    paths = [variant_source_path(name), os.path.join(SCRIPTS_DIR, f'{BASE_MODULE}.py')]
+    return list(dict.fromkeys(paths))
+
+def load_variant(name):
+    """Import the generator module for a variant and return its render function"""
+    module_name, func_name = VARIANTS[name]
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+CosmicBoard Icon Parameter Sweep
+Renders every combination of design parameters for one variant as a
+thumbnail, in parallel, and lays them out on a labelled contact sheet with
+a JSON index. Picked combinations can then be re-rendered at full size.
+
+Example:
+    python3 scripts/sweep_app_icons.py run v1-orbital-alignment \\
+        --param ring_count=2:5 --param glow_intensity=10:40:5 \\
+        --param node_colors=default,warm,cool,mono
+    python3 scripts/sweep_app_icons.py select 12 87
+"""
+
+from PIL import Image, ImageDraw
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import inspect
+import itertools
+import json
+import math
+import os
+import time
+
+from icon_buffers import IconBuffer
+from icon_variants import ICONS_ROOT, VARIANTS, load_variant
+
+THUMBNAIL_SIZE = 128
+FULL_SIZE = 1024
+LINE_HEIGHT = 12
+
+_atlas = None  # per-worker attachment to the shared thumbnail atlas
+
+# Named node palettes for the node_colors parameter ('default' keeps the design's own)
+NODE_PALETTES = {
+    'default': None,
+    'warm': [(255, 180, 100), (255, 120, 120), (255, 210, 120), (255, 150, 200)],
+    'cool': [(150, 200, 255), (120, 160, 255), (180, 255, 230), (200, 180, 255)],
+    'mono': [(255, 255, 255), (230, 220, 255), (210, 200, 240), (255, 240, 255)],
+}
+
+# Numeric sweep parameters: (type, lowest, highest, description). Integer
+# ranges are inclusive; safe_scale must stay above 0 so the icon has a size
+PARAM_RANGES = {
+    'ring_count': (int, 1, None, 'an integer >= 1'),
+    'glow_intensity': (int, 0, 255, 'an integer from 0 to 255'),
+    'safe_scale': (float, 0, 1, 'a number in (0, 1]'),
+}
+
+def parse_values(spec):
+    """
+    Parse a parameter range: 'a,b,c' lists values, 'start:stop[:step]' is an
+    inclusive numeric range (step defaults to 1; values never pass stop)
+    """
+    def number(text):
+        try:
+            return int(text)
+        except ValueError:
+            return float(text)
+
+    if ':' in spec:
+        parts = [number(part) for part in spec.split(':')]
+        if len(parts) not in (2, 3):
+            raise ValueError(f'expected start:stop[:step], got {spec!r}')
+        start, stop = parts[:2]
+        step = parts[2] if len(parts) == 3 else 1
+        if step <= 0:
+            raise ValueError(f'step must be positive, got {spec!r}')
+        # floor (with slack for float error) so the last value never passes stop
+        count = math.floor((stop - start) / step + 1e-9) + 1
+        if count < 1:
+            raise ValueError(f'empty range (stop is below start), got {spec!r}')
+        return [round(start + index * step, 6) for index in range(count)]
+
+    values = []
+    for part in spec.split(','):
+        try:
+            values.append(number(part))
+        except ValueError:
+            values.append(part)
+    return values
+
+def check_values(name, values):
+    """Reject values a generator would choke on, before any worker starts"""
+    if name == 'node_colors':
+        unknown = [value for value in values if value not in NODE_PALETTES]
+        if unknown:
+            raise ValueError(f"unknown node palette(s) {unknown} "
+                             f"(choose from: {', '.join(NODE_PALETTES)})")
+        return
+
+    kind, low, high, expected = PARAM_RANGES[name]
+    types = (int, float) if kind is float else int
+    for value in values:
+        if isinstance(value, bool) or not isinstance(value, types):
+            raise ValueError(f'{name} must be {expected}, got {value!r}')
+        above_low = value > low if kind is float else value >= low
+        if not above_low or (high is not None and value > high):
+            raise ValueError(f'{name} must be {expected}, got {value}')
+
+def resolve_params(params):
+    """Turn JSON-friendly sweep params into render keyword arguments"""
+    kwargs = dict(params)
+    if 'node_colors' in kwargs:
+        kwargs['node_colors'] = NODE_PALETTES[kwargs['node_colors']]
+    return kwargs
+
+def label_for(index, params):
+    """Short contact-sheet label: index, then one abbreviated param per line"""
+    lines = [f'#{index}']
+    for name, value in params.items():
+        short = ''.join(word[0] for word in name.split('_'))
+        lines.append(f'{short}={value}')
+    return lines
+
+def _attach_atlas(handle):
+    """Worker initializer: attach once to the shared thumbnail atlas"""
+    global _atlas
+    _atlas = IconBuffer.attach(handle)
+
+def render_thumbnail(task):
+    """Render one combination straight into its atlas slot (runs in a worker)"""
+    variant, params, size, slot = task
+    img = load_variant(variant)(size, **resolve_params(params))
+    _atlas.write(img, top=slot * size)
+
+def create_contact_sheet(thumbnails, labels, size, columns):
+    """Lay thumbnails out on a grid with a label block under each one"""
+    cell_height = size + LINE_HEIGHT * max(len(lines) for lines in labels) + 6
+    rows = math.ceil(len(thumbnails) / columns)
+    sheet = Image.new('RGBA', (columns * size, rows * cell_height), (18, 12, 36, 255))
+    draw = ImageDraw.Draw(sheet)
+    cells = []
+
+    for index, (thumbnail, lines) in enumerate(zip(thumbnails, labels)):
+        column, row = index % columns, index // columns
+        x, y = column * size, row * cell_height
+        sheet.alpha_composite(thumbnail, (x, y))
+        for line_number, line in enumerate(lines):
+            draw.text((x + 4, y + size + 3 + line_number * LINE_HEIGHT), line,
+                      fill=(255, 255, 255, 255))
+        cells.append([x, y, size, size])
+
+    return sheet, cells
+
+def run_sweep(variant, grid, output_dir, size=THUMBNAIL_SIZE, jobs=None, columns=None):
+    """Render every combination in `grid` and write the contact sheet and index"""
+    names = list(grid)
+    combos = [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+    columns = columns or math.ceil(math.sqrt(len(combos)))
+    os.makedirs(output_dir, exist_ok=True)
+
+    print(f"🎛️  Sweeping {variant}: {len(combos)} combinations at {size}px")
+    start = time.perf_counter()
+
+    tasks = [(variant, params, size, slot) for slot, params in enumerate(combos)]
+    jobs = jobs or os.cpu_count()
+    # Contiguous chunks keep runs of the same backdrop on one worker's cache
+    chunksize = max(1, len(tasks) // (jobs * 4))
+
+    # Workers write thumbnails into one shared atlas (a column of slots)
+    # instead of pickling each frame back to this process
+    with IconBuffer.create(size, size * len(combos)) as atlas:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_attach_atlas,
+                                 initargs=(atlas.handle,)) as executor:
+            list(executor.map(render_thumbnail, tasks, chunksize=chunksize))
+
+        thumbnails = [atlas.image(slot * size, size) for slot in range(len(combos))]
+        labels = [label_for(index, params) for index, params in enumerate(combos)]
+        try:
+            sheet, cells = create_contact_sheet(thumbnails, labels, size, columns)
+        finally:
+            # The atlas can't be closed while views into it are alive
+            for thumbnail in thumbnails:
+                thumbnail.close()
+
+    sheet_path = os.path.join(output_dir, 'contact-sheet.png')
+    sheet.save(sheet_path, 'PNG')
+    index_path = os.path.join(output_dir, 'index.json')
+    with open(index_path, 'w') as index_file:
+        json.dump({
+            'variant': variant,
+            'size': size,
+            'grid': grid,
+            'entries': [{'index': index, 'params': params, 'cell': cell}
+                        for index, (params, cell) in enumerate(zip(combos, cells))],
+        }, index_file, indent=2)
+
+    elapsed = time.perf_counter() - start
+    print(f"✓ Rendered {len(combos)} thumbnails in {elapsed:.1f}s")
+    print(f"✓ Saved {sheet_path}")
+    print(f"✓ Saved {index_path}")
+
+def render_selected(output_dir, indices, size=FULL_SIZE):
+    """Re-render chosen combinations from a sweep's index.json at full size"""
+    with open(os.path.join(output_dir, 'index.json')) as index_file:
+        index = json.load(index_file)
+
+    entries = index['entries']
+    invalid = [position for position in indices if not 0 <= position < len(entries)]
+    if invalid:
+        raise ValueError(f'no sweep entries {invalid} (valid: 0-{len(entries) - 1})')
+
+    render = load_variant(index['variant'])
+    selected_dir = os.path.join(output_dir, 'selected')
+    os.makedirs(selected_dir, exist_ok=True)
+
+    for position in indices:
+        entry = entries[position]
+        img = render(size, **resolve_params(entry['params']))
+        filepath = os.path.join(selected_dir, f"{index['variant']}-{position}-{size}.png")
+        img.save(filepath, 'PNG')
+        print(f"✓ Saved {filepath}  {entry['params']}")
+
+def main():
+    """Parameter sweep entry point"""
+    parser = argparse.ArgumentParser(description='Sweep icon design parameters into a contact sheet')
+    parser.add_argument('--out', default=os.path.join(ICONS_ROOT, '.sweep'),
+                        help='directory for the contact sheet, index and selections')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='render all combinations as thumbnails')
+    run_parser.add_argument('variant', choices=sorted(VARIANTS))
+    run_parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUES',
+                            help="e.g. ring_count=2:5, safe_scale=0.7:0.9:0.05, node_colors=warm,cool")
+    run_parser.add_argument('--size', type=int, default=THUMBNAIL_SIZE,
+                            help=f'thumbnail size in px (default: {THUMBNAIL_SIZE})')
+    run_parser.add_argument('--jobs', type=int, help='worker processes (default: CPU count)')
+    run_parser.add_argument('--columns', type=int, help='contact sheet columns (default: square grid)')
+
+    select_parser = commands.add_parser('select', help='re-render chosen combinations at full size')
+    select_parser.add_argument('indices', type=int, nargs='+')
+    select_parser.add_argument('--size', type=int, default=FULL_SIZE,
+                               help=f'output size in px (default: {FULL_SIZE})')
+
+    args = parser.parse_args()
+
+    if args.command == 'select':
+        try:
+            render_selected(args.out, args.indices, args.size)
+        except ValueError as error:
+            parser.error(str(error))
+        return
+
+    accepted = set(inspect.signature(load_variant(args.variant)).parameters) - {'size'}
+    grid = {}
+    for spec in args.param:
+        name, _, values = spec.partition('=')
+        if name not in accepted:
+            parser.error(f"{args.variant} has no parameter {name!r} "
+                         f"(accepts: {', '.join(sorted(accepted)) or 'none'})")
+        try:
+            grid[name] = parse_values(values)
+            check_values(name, grid[name])
+        except ValueError as error:
+            parser.error(f'--param {spec}: {error}')
+    if not grid:
+        parser.error('at least one --param is required')
+
+    run_sweep(args.variant, grid, args.out, args.size, args.jobs, args.columns)
+
+if __name__ == '__main__':
+    main()
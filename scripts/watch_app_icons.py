@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+CosmicBoard Icon Watch Mode
+Watches the icon generator scripts and, on every save, re-renders only the
+variants whose scene definition changed:
+- a fast low-res preview straight away (well under a second)
+- a full-resolution render in a background process, cancelled if stale
+- a contact sheet of the latest previews that image viewers live-refresh
+"""
+
+from PIL import Image, ImageDraw
+import argparse
+import hashlib
+import importlib
+import inspect
+import multiprocessing
+import os
+import sys
+import time
+import types
+
+from icon_variants import ICONS_ROOT, SCRIPTS_DIR, VARIANTS, load_variant
+
+PREVIEW_SIZE = 256
+FULL_SIZE = 1024
+POLL_INTERVAL = 0.2  # seconds between source mtime checks
+LABEL_HEIGHT = 24
+# Registry order puts generate_app_icons first, which the others import from
+VARIANT_MODULES = list(dict.fromkeys(module_name for module_name, _ in VARIANTS.values()))
+
+def _code_names(code):
+    """Collect global names used by a code object, including nested code"""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _code_names(const)
+    return names
+
+def scene_fingerprint(func):
+    """
+    Hash a render function together with the module-level helpers and
+    constants it uses, so an edit to one variant leaves the others untouched
+    """
+    digest = hashlib.sha256()
+    seen = set()
+    pending = [func]
+
+    while pending:
+        current = pending.pop()
+        key = (current.__module__, current.__name__)
+        if key in seen:
+            continue
+        seen.add(key)
+        digest.update(inspect.getsource(current).encode())
+
+        module = sys.modules[current.__module__]
+        for name in sorted(_code_names(current.__code__)):
+            value = module.__dict__.get(name)
+            value = getattr(value, '__wrapped__', value)  # look through lru_cache
+            if isinstance(value, types.FunctionType) and value.__module__ in VARIANT_MODULES:
+                pending.append(value)
+            elif isinstance(value, (int, float, str, tuple, list, dict)):
+                digest.update(f'{name}={value!r}'.encode())
+
+    return digest.hexdigest()
+
+def save_atomic(img, path):
+    """Save a PNG via rename so viewers never pick up a half-written file"""
+    tmp_path = f'{path}.tmp'
+    img.save(tmp_path, 'PNG')
+    os.replace(tmp_path, path)
+
+def render_full(name, output_path):
+    """Render a variant at full resolution (runs in a background process)"""
+    render = load_variant(name)
+    save_atomic(render(FULL_SIZE), output_path)
+
+def create_contact_sheet(previews, cell_size):
+    """Lay out the latest previews side by side with their variant names"""
+    sheet = Image.new('RGBA', (cell_size * max(len(previews), 1), cell_size + LABEL_HEIGHT),
+                      (18, 12, 36, 255))
+    draw = ImageDraw.Draw(sheet)
+
+    for index, (name, preview) in enumerate(previews.items()):
+        x = index * cell_size
+        sheet.alpha_composite(preview.convert('RGBA'), (x, 0))
+        draw.text((x + 8, cell_size + 6), name, fill=(255, 255, 255, 255))
+
+    return sheet
+
+class IconWatcher:
+    """Tracks generator sources and keeps the preview outputs up to date"""
+
+    def __init__(self, variants, output_dir, preview_size=PREVIEW_SIZE, full_render=True):
+        self.variants = variants
+        self.output_dir = output_dir
+        self.preview_size = preview_size
+        self.full_render = full_render
+        self.mtimes = {}
+        self.fingerprints = {}
+        self.previews = {}
+        self.full_renders = {}
+
+    def sources_changed(self):
+        """Check whether any generator source file changed since the last poll"""
+        changed = False
+        for module_name in VARIANT_MODULES:
+            path = os.path.join(SCRIPTS_DIR, f'{module_name}.py')
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            if self.mtimes.get(module_name) != mtime:
+                self.mtimes[module_name] = mtime
+                changed = True
+        return changed
+
+    def reload(self):
+        """(Re)import every generator module in dependency order"""
+        for module_name in VARIANT_MODULES:
+            try:
+                if module_name in sys.modules:
+                    importlib.reload(sys.modules[module_name])
+                else:
+                    importlib.import_module(module_name)
+            except Exception as error:
+                print(f'✗ {module_name}: {type(error).__name__}: {error}')
+
+    def refresh(self):
+        """Re-render every watched variant whose scene changed"""
+        changed = []
+        for name in self.variants:
+            try:
+                fingerprint = scene_fingerprint(load_variant(name))
+            except Exception as error:
+                print(f'✗ {name}: {type(error).__name__}: {error}')
+                continue
+            if self.fingerprints.get(name) != fingerprint:
+                self.fingerprints[name] = fingerprint
+                changed.append(name)
+
+        for name in changed:
+            self.render_preview(name)
+
+        if changed and self.previews:
+            sheet = create_contact_sheet(self.previews, self.preview_size)
+            save_atomic(sheet, os.path.join(self.output_dir, 'contact-sheet.png'))
+
+    def render_preview(self, name):
+        """Render the low-res preview now and queue the full-resolution render"""
+        start = time.perf_counter()
+        try:
+            preview = load_variant(name)(self.preview_size)
+        except Exception as error:
+            print(f'✗ {name}: {type(error).__name__}: {error}')
+            return
+
+        save_atomic(preview, os.path.join(self.output_dir, f'preview-{name}.png'))
+        self.previews[name] = preview
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f'✓ {name}: {self.preview_size}px preview in {elapsed:.0f}ms')
+
+        if self.full_render:
+            self.start_full_render(name)
+
+    def start_full_render(self, name):
+        """Start a background full-res render, cancelling any stale one"""
+        self.cancel(name)
+        output_path = os.path.join(self.output_dir, f'full-{name}.png')
+        process = multiprocessing.Process(target=render_full, args=(name, output_path),
+                                          daemon=True)
+        process.start()
+        self.full_renders[name] = (process, time.perf_counter())
+
+    def cancel(self, name):
+        """Terminate the in-flight full-res render for a variant, if any"""
+        running = self.full_renders.pop(name, None)
+        if running is not None and running[0].is_alive():
+            running[0].terminate()
+            running[0].join()
+
+    def reap(self):
+        """Report full-res renders that finished since the last poll"""
+        for name, (process, started) in list(self.full_renders.items()):
+            if process.is_alive():
+                continue
+            del self.full_renders[name]
+            if process.exitcode == 0:
+                elapsed = time.perf_counter() - started
+                print(f'✓ {name}: {FULL_SIZE}px render in {elapsed:.1f}s')
+            else:
+                print(f'✗ {name}: full render failed (exit code {process.exitcode})')
+
+    def run(self):
+        """Poll the generator sources until interrupted"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        print(f"👀 Watching {', '.join(VARIANT_MODULES)}")
+        print(f"📁 Previews: {self.output_dir}")
+
+        try:
+            while True:
+                if self.sources_changed():
+                    self.reload()
+                    self.refresh()
+                self.reap()
+                time.sleep(POLL_INTERVAL)
+        except KeyboardInterrupt:
+            print("\n👋 Stopping watch mode")
+        finally:
+            for name in list(self.full_renders):
+                self.cancel(name)
+
+def main():
+    """Watch icon generator scripts and live-render previews"""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--variants', nargs='+', choices=sorted(VARIANTS),
+                        default=list(VARIANTS), help='variants to watch (default: all)')
+    parser.add_argument('--out', default=os.path.join(ICONS_ROOT, '.watch'),
+                        help='directory for preview PNGs and the contact sheet')
+    parser.add_argument('--preview-size', type=int, default=PREVIEW_SIZE,
+                        help=f'preview resolution in px (default: {PREVIEW_SIZE})')
+    parser.add_argument('--no-full', action='store_true',
+                        help='skip the background full-resolution renders')
+    args = parser.parse_args()
+
+    watcher = IconWatcher(args.variants, args.out, args.preview_size,
+                          full_render=not args.no_full)
+    watcher.run()
+
+if __name__ == '__main__':
+    main()